@@ -2,108 +2,215 @@
 """
 Build Script - Regenerates index.html with fresh data from JSON files
 Run this after the scrapers to update the site.
+
+The page source lives in templates/index.html; edit that file, not the
+generated index.html. Placeholders are ${COMPANIES}, ${VCS}, ${JOBS} and
+${UPDATED}.
+
+The build is skipped when none of its inputs have changed since the last
+run; delete index.html.hash to force a rebuild.
 """
 
+import hashlib
 import json
 import os
-from datetime import datetime
+import re
+import time
+from collections import Counter
+from html import escape
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
+
+TEMPLATE_PATH = 'templates/index.html'
+OUTPUT_PATH = 'index.html'
+STAMP_PATH = 'index.html.hash'
+BUILD_INPUTS = [
+    'data/companies.json',
+    'data/vcs.json',
+    'data/jobs.json',
+    TEMPLATE_PATH,
+    __file__,
+]
+
+# Only ${UPPERCASE} tokens are placeholders, so the page's own `$` signs pass through
+_PLACEHOLDER_RE = re.compile(r'\$\{([A-Z_]+)\}')
+
+# Funding amounts look like "$1.5B", "$300M" or "YC Backed"
+_AMOUNT_RE = re.compile(r'([\d.]+)\s*([BMK]?)', re.IGNORECASE)
+_AMOUNT_SCALE = {'B': 1000, 'M': 1, 'K': 0.001, '': 1}
+
+
+def load_json(path, key):
+    """Load the list stored under key in a JSON data file."""
+    if not os.path.exists(path):
+        return []
+    with open(path, 'rb') as f:
+        raw = f.read()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    return data.get(key, [])
+
+
+def inputs_key():
+    """Fingerprint the build inputs by path, mtime and size."""
+    key = hashlib.blake2b(digest_size=16)
+    for path in BUILD_INPUTS:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            key.update(f'{path}:missing;'.encode())
+            continue
+        key.update(f'{path}:{st.st_mtime_ns}:{st.st_size};'.encode())
+    return key.hexdigest()
+
+
+def build_stamp(key):
+    """Pair the inputs key with index.html's current mtime and size, or None if it is missing."""
+    try:
+        st = os.stat(OUTPUT_PATH)
+    except FileNotFoundError:
+        return None
+    return f'{key} {st.st_mtime_ns}:{st.st_size}'
+
+
+def is_up_to_date(key):
+    """Check whether index.html was built from inputs matching key and is untouched since."""
+    stamp = Path(STAMP_PATH)
+    expected = build_stamp(key)
+    return (
+        expected is not None
+        and stamp.exists()
+        and stamp.read_text(encoding='utf-8').strip() == expected
+    )
+
+
+def to_js(data):
+    """Serialize data as a compact JSON literal for embedding in the page script."""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
 
 
-def load_json(path, default_key='items'):
-    """Load data from JSON file."""
-    if os.path.exists(path):
-        with open(path) as f:
-            return json.load(f)
-    return {default_key: []}
+def parse_amount(amount):
+    """Convert a display amount like "$1.5B" to millions (0 if unknown)."""
+    match = _AMOUNT_RE.search(amount or '')
+    if not match:
+        return 0
+    try:
+        value = float(match.group(1))
+    except ValueError:
+        return 0
+    return value * _AMOUNT_SCALE[match.group(2).upper()]
+
+
+def add_derived_fields(companies):
+    """Precompute values the page would otherwise derive on every render."""
+    for c in companies:
+        # Tab-separated so a search can't match across two fields
+        c['_haystack'] = '\t'.join([
+            c.get('name') or '',
+            c.get('tagline') or '',
+            ' '.join(c.get('investors') or []),
+        ]).lower()
+        c['_amountM'] = parse_amount(c.get('amount'))
+
+
+def _esc(value):
+    """HTML-escape a field value, treating None as empty."""
+    return escape('' if value is None else str(value))
+
+
+def add_card_html(companies, vcs, jobs):
+    """Pre-render each company card so the page only has to join strings."""
+    vcs_by_id = {vc.get('id'): vc for vc in vcs}
+    job_counts = Counter(job.get('companyId') for job in jobs)
+    
+    for c in companies:
+        badges = ''.join(
+            f'<span class="investor-badge">{_esc(vc.get("logo"))} {_esc(vc.get("shortName"))}</span>'
+            for vc in (vcs_by_id.get(vc_id) for vc_id in c.get('investors') or [])
+            if vc
+        )
+        tags = ''.join(f'<span class="tag">{_esc(t)}</span>' for t in c.get('tags') or [])
+        c['_html'] = (
+            f'<div class="company-card" onclick="selectCompany(\'{_esc(c.get("id"))}\')">'
+            f'<div class="company-top"><span class="company-name">{_esc(c.get("name"))}</span>'
+            f'<span class="funding-amount">{_esc(c.get("amount"))}</span></div>'
+            f'<div class="company-tagline">{_esc(c.get("tagline"))}</div>'
+            f'<div class="company-meta"><span>{_esc(c.get("round"))}</span><span class="meta-dot"></span>'
+            f'<span>{_esc(c.get("daysAgo"))}</span><span class="meta-dot"></span>'
+            f'<span>{job_counts[c.get("id")]} jobs</span></div>'
+            f'<div class="company-investors">{badges}</div>'
+            f'<div class="company-tags">{tags}</div>'
+            '</div>'
+        )
+
+
+def render_to(f, template, values):
+    """Write template to f, replacing each ${NAME} placeholder with values[NAME].
+
+    Pieces are written as they are produced, so the full page is never
+    assembled in memory.
+    """
+    pos = 0
+    for match in _PLACEHOLDER_RE.finditer(template):
+        f.write(template[pos:match.start()])
+        f.write(values[match.group(1)])
+        pos = match.end()
+    f.write(template[pos:])
 
 
 def main():
     print("🔨 Building FundedList site...")
     
+    key = inputs_key()
+    if is_up_to_date(key):
+        print("⏭  index.html is up to date, nothing to build")
+        return
+    
     # Load data from JSON files
-    companies_data = load_json('data/companies.json', 'companies')
-    vcs_data = load_json('data/vcs.json', 'vcs')
-    jobs_data = load_json('data/jobs.json', 'jobs')
+    companies = load_json('data/companies.json', 'companies')
+    vcs = load_json('data/vcs.json', 'vcs')
+    jobs = load_json('data/jobs.json', 'jobs')
     
-    companies = companies_data.get('companies', [])
-    vcs = vcs_data.get('vcs', [])
-    jobs = jobs_data.get('jobs', [])
+    print('\n'.join([
+        f"   Loaded {len(companies)} companies",
+        f"   Loaded {len(vcs)} VCs",
+        f"   Loaded {len(jobs)} jobs",
+    ]))
     
-    print(f"   Loaded {len(companies)} companies")
-    print(f"   Loaded {len(vcs)} VCs")
-    print(f"   Loaded {len(jobs)} jobs")
+    # Read the template
+    template = Path(TEMPLATE_PATH).read_text(encoding='utf-8')
     
-    # Read the template (current index.html)
-    with open('index.html', 'r') as f:
-        html = f.read()
+    add_derived_fields(companies)
+    add_card_html(companies, vcs, jobs)
     
     # Convert data to JavaScript strings
-    companies_js = json.dumps(companies, indent=8, ensure_ascii=False)
-    vcs_js = json.dumps(vcs, indent=8, ensure_ascii=False)
-    jobs_js = json.dumps(jobs, indent=8, ensure_ascii=False)
-    
-    # Find and replace data arrays using string operations (not regex)
-    # This avoids issues with special characters in the JSON
-    
-    # Replace companies array
-    start_marker = 'const companies = ['
-    start_idx = html.find(start_marker)
-    if start_idx != -1:
-        # Find the closing ];
-        bracket_count = 0
-        end_idx = start_idx + len(start_marker) - 1
-        for i in range(start_idx + len(start_marker) - 1, len(html)):
-            if html[i] == '[':
-                bracket_count += 1
-            elif html[i] == ']':
-                bracket_count -= 1
-                if bracket_count == 0:
-                    end_idx = i + 1
-                    break
-        html = html[:start_idx] + 'const companies = ' + companies_js + ';' + html[end_idx+1:]
-    
-    # Replace vcs array
-    start_marker = 'const vcs = ['
-    start_idx = html.find(start_marker)
-    if start_idx != -1:
-        bracket_count = 0
-        end_idx = start_idx + len(start_marker) - 1
-        for i in range(start_idx + len(start_marker) - 1, len(html)):
-            if html[i] == '[':
-                bracket_count += 1
-            elif html[i] == ']':
-                bracket_count -= 1
-                if bracket_count == 0:
-                    end_idx = i + 1
-                    break
-        html = html[:start_idx] + 'const vcs = ' + vcs_js + ';' + html[end_idx+1:]
-    
-    # Replace jobs array
-    start_marker = 'const jobs = ['
-    start_idx = html.find(start_marker)
-    if start_idx != -1:
-        bracket_count = 0
-        end_idx = start_idx + len(start_marker) - 1
-        for i in range(start_idx + len(start_marker) - 1, len(html)):
-            if html[i] == '[':
-                bracket_count += 1
-            elif html[i] == ']':
-                bracket_count -= 1
-                if bracket_count == 0:
-                    end_idx = i + 1
-                    break
-        html = html[:start_idx] + 'const jobs = ' + jobs_js + ';' + html[end_idx+1:]
-    
-    # Update the footer date
-    today = datetime.now().strftime('%b %d, %Y')
-    html = html.replace('Updated Jan 17, 2026', f'Updated {today}')
+    companies_js = to_js(companies)
+    vcs_js = to_js(vcs)
+    jobs_js = to_js(jobs)
+    today = time.strftime('%b %d, %Y')
     
-    # Write the updated HTML
-    with open('index.html', 'w') as f:
-        f.write(html)
+    # Stream the filled-in template to a temp file, then swap it in so a
+    # failed build never leaves a half-written index.html behind
+    tmp_path = OUTPUT_PATH + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        render_to(f, template, {
+            'COMPANIES': companies_js,
+            'VCS': vcs_js,
+            'JOBS': jobs_js,
+            'UPDATED': today,
+        })
+    os.replace(tmp_path, OUTPUT_PATH)
+    Path(STAMP_PATH).write_text(build_stamp(key), encoding='utf-8')
     
-    print(f"✅ Built index.html with fresh data")
-    print(f"   Updated: {today}")
+    print('\n'.join([
+        "✅ Built index.html with fresh data",
+        f"   Updated: {today}",
+    ]))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Data IO - Shared JSON writer for the scrapers' data/*.json exports
+Uses orjson when installed and the stdlib encoder otherwise; both produce
+the same 2-space indented output.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
+
+
+def write_json(path, payload):
+    """Write payload to path as 2-space indented JSON."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+HTTP Client - Shared requests session for the scrapers
+Keeps connections open per host and retries transient failures.
+
+Responses are cached on disk (scraper_cache.sqlite) for CACHE_EXPIRY when
+requests-cache is installed. Set CACHE_MODE to control it:
+  enabled   use cached responses, fetch and store on a miss (default)
+  replay    only serve cached responses; misses come back as 504
+  disabled  always hit the network
+"""
+
+import os
+from datetime import timedelta
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import requests_cache
+except ImportError:  # caching is optional
+    requests_cache = None
+
+USER_AGENT = 'Mozilla/5.0 (compatible; FundedList/1.0)'
+
+# (connect, read) timeouts in seconds
+TIMEOUT = (3, 10)
+
+CACHE_NAME = 'scraper_cache'
+CACHE_EXPIRY = timedelta(hours=6)
+CACHE_MODES = ('enabled', 'replay', 'disabled')
+CACHE_MODE = (os.environ.get('CACHE_MODE') or 'enabled').strip().lower()
+if CACHE_MODE not in CACHE_MODES:
+    raise ValueError(f"CACHE_MODE must be one of {', '.join(CACHE_MODES)}; got {CACHE_MODE!r}")
+
+
+def make_session():
+    """Create a session with pooled connections and retries on transient errors."""
+    if requests_cache is not None and CACHE_MODE != 'disabled':
+        session = requests_cache.CachedSession(
+            CACHE_NAME,
+            backend='sqlite',
+            expire_after=CACHE_EXPIRY,
+            only_if_cached=CACHE_MODE == 'replay',
+        )
+    else:
+        session = requests.Session()
+    
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['User-Agent'] = USER_AGENT
+    return session
+
+
+SESSION = make_session()
@@ -6,10 +6,22 @@ Uses company career pages and job board APIs
 
 import json
 import os
+import random
 import re
 from datetime import datetime
-import requests
-from bs4 import BeautifulSoup
+from functools import lru_cache
+from itertools import islice
+import lxml.html
+from cssselect import HTMLTranslator
+from lxml import etree
+
+from data_io import write_json
+from http_client import SESSION, TIMEOUT
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib decoder
+    orjson = None
 
 # Common career page patterns
 CAREER_PATTERNS = [
@@ -21,22 +33,82 @@ CAREER_PATTERNS = [
     '/company/careers',
 ]
 
+# Elements on a career page that usually wrap a single job listing
+JOB_SELECTORS = [
+    '.job-listing', '.job-card', '.position', '.opening',
+    '[class*="job"]', '[class*="position"]', '[class*="career"]'
+]
+
+
+def compile_selector(css, prefix='descendant-or-self::'):
+    """Translate a CSS selector to a compiled XPath evaluator."""
+    return etree.XPath(HTMLTranslator().css_to_xpath(css, prefix=prefix))
+
+
+# Compiled once at import. A single walk of the page collects every candidate
+# listing; each selector is then tested against those candidates only, in
+# priority order. The per-listing selectors only look inside the listing
+# element, like BeautifulSoup's select_one()
+_JOB_CANDIDATES = compile_selector(', '.join(JOB_SELECTORS))
+_JOB_MATCHERS = [compile_selector(s, prefix='self::') for s in JOB_SELECTORS]
+_TITLE_SELECTOR = compile_selector('h2, h3, h4, .title, [class*="title"]', prefix='descendant::')
+_LOCATION_SELECTOR = compile_selector('.location, [class*="location"]', prefix='descendant::')
+_LINK_SELECTOR = compile_selector('a[href]', prefix='descendant::')
+
+# Title keywords per department, in priority order; the first match wins
+DEPARTMENT_KEYWORDS = [
+    ('engineering', ['engineer', 'developer', 'swe', 'devops', 'sre', 'architect', 'data scientist']),
+    ('product', ['product manager', 'pm', 'product lead', 'product owner']),
+    ('design', ['design', 'ux', 'ui', 'creative']),
+    ('sales', ['sales', 'account', 'business development', 'bd', 'gtm', 'revenue',
+               'marketing', 'growth', 'content', 'brand', 'communications']),
+    ('operations', ['operations', 'ops', 'finance', 'hr', 'people', 'legal', 'admin']),
+]
+
+# One alternation per department, so each check is a single scan of the title
+_DEPARTMENT_PATTERNS = [
+    (dept, re.compile('|'.join(map(re.escape, keywords))))
+    for dept, keywords in DEPARTMENT_KEYWORDS
+]
+
+
+def parse_html(response):
+    """Parse an HTML response, honouring the charset from its Content-Type header."""
+    if response.encoding:
+        try:
+            parser = lxml.html.HTMLParser(encoding=response.encoding)
+        except LookupError:  # unknown charset; let libxml2 sniff the bytes
+            pass
+        else:
+            return lxml.html.fromstring(response.content, parser=parser)
+    return lxml.html.fromstring(response.content)
+
+
+def decode_json(response):
+    """Decode a JSON response body, with orjson when it's available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
 
 def scrape_greenhouse_jobs(company_name, greenhouse_id):
     """Scrape jobs from Greenhouse job board."""
     jobs = []
     try:
         url = f"https://boards-api.greenhouse.io/v1/boards/{greenhouse_id}/jobs"
-        response = requests.get(url, timeout=10)
+        response = SESSION.get(url, timeout=TIMEOUT)
         
         if response.status_code == 200:
-            data = response.json()
-            for job in data.get('jobs', []):
-                jobs.append({
+            data = decode_json(response)
+            append = jobs.append
+            for job in data.get('jobs', ()):
+                title = job.get('title')
+                location = job.get('location') or {}
+                append({
                     'company': company_name,
-                    'title': job.get('title'),
-                    'location': job.get('location', {}).get('name', 'Remote'),
-                    'department': categorize_department(job.get('title', '')),
+                    'title': title,
+                    'location': location.get('name', 'Remote'),
+                    'department': categorize_department(title or ''),
                     'url': job.get('absolute_url'),
                     'posted': 'Recently',
                 })
@@ -51,16 +123,18 @@ def scrape_lever_jobs(company_name, lever_id):
     jobs = []
     try:
         url = f"https://api.lever.co/v0/postings/{lever_id}"
-        response = requests.get(url, timeout=10)
+        response = SESSION.get(url, timeout=TIMEOUT)
         
         if response.status_code == 200:
-            data = response.json()
+            data = decode_json(response)
+            append = jobs.append
             for job in data:
-                jobs.append({
+                categories = job.get('categories') or {}
+                append({
                     'company': company_name,
                     'title': job.get('text'),
-                    'location': job.get('categories', {}).get('location', 'Remote'),
-                    'department': job.get('categories', {}).get('team', 'General'),
+                    'location': categories.get('location', 'Remote'),
+                    'department': categories.get('team', 'General'),
                     'url': job.get('hostedUrl'),
                     'posted': 'Recently',
                 })
@@ -74,33 +148,28 @@ def scrape_career_page(company_name, career_url):
     """Generic career page scraper."""
     jobs = []
     try:
-        headers = {'User-Agent': 'Mozilla/5.0 (compatible; FundedList/1.0)'}
-        response = requests.get(career_url, headers=headers, timeout=10)
+        response = SESSION.get(career_url, timeout=TIMEOUT)
         
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
+            tree = parse_html(response)
             
             # Look for job listings
-            job_selectors = [
-                '.job-listing', '.job-card', '.position', '.opening',
-                '[class*="job"]', '[class*="position"]', '[class*="career"]'
-            ]
-            
-            for selector in job_selectors:
-                for element in soup.select(selector)[:20]:
-                    title_el = element.select_one('h2, h3, h4, .title, [class*="title"]')
-                    location_el = element.select_one('.location, [class*="location"]')
-                    link_el = element.select_one('a[href]')
+            candidates = _JOB_CANDIDATES(tree)
+            for matches in _JOB_MATCHERS:
+                for element in islice((el for el in candidates if matches(el)), 20):
+                    title_el = next(iter(_TITLE_SELECTOR(element)), None)
+                    location_el = next(iter(_LOCATION_SELECTOR(element)), None)
+                    link_el = next(iter(_LINK_SELECTOR(element)), None)
                     
-                    if title_el:
-                        title = title_el.get_text().strip()
+                    if title_el is not None:
+                        title = ''.join(title_el.itertext()).strip()
                         if len(title) > 5 and len(title) < 100:
                             jobs.append({
                                 'company': company_name,
                                 'title': title,
-                                'location': location_el.get_text().strip() if location_el else 'Remote',
+                                'location': ''.join(location_el.itertext()).strip() if location_el is not None else 'Remote',
                                 'department': categorize_department(title),
-                                'url': link_el.get('href') if link_el else career_url,
+                                'url': link_el.get('href') if link_el is not None else career_url,
                                 'posted': 'Recently',
                             })
                 
@@ -113,22 +182,14 @@ def scrape_career_page(company_name, career_url):
     return jobs
 
 
+@lru_cache(maxsize=4096)
 def categorize_department(title):
     """Categorize job by department based on title."""
     title_lower = title.lower()
     
-    if any(kw in title_lower for kw in ['engineer', 'developer', 'swe', 'devops', 'sre', 'architect', 'data scientist']):
-        return 'engineering'
-    elif any(kw in title_lower for kw in ['product manager', 'pm', 'product lead', 'product owner']):
-        return 'product'
-    elif any(kw in title_lower for kw in ['design', 'ux', 'ui', 'creative']):
-        return 'design'
-    elif any(kw in title_lower for kw in ['sales', 'account', 'business development', 'bd', 'gtm', 'revenue']):
-        return 'sales'
-    elif any(kw in title_lower for kw in ['marketing', 'growth', 'content', 'brand', 'communications']):
-        return 'sales'
-    elif any(kw in title_lower for kw in ['operations', 'ops', 'finance', 'hr', 'people', 'legal', 'admin']):
-        return 'operations'
+    for dept, pattern in _DEPARTMENT_PATTERNS:
+        if pattern.search(title_lower):
+            return dept
     
     return 'engineering'
 
@@ -157,15 +218,18 @@ def generate_sample_jobs(companies):
     jobs = []
     job_id = 1
     
+    rng = random.Random(42)  # Same sample jobs on every run
+    randint, choice = rng.randint, rng.choice
+    departments = list(sample_titles)
+    
     for company in companies:
         # Generate 2-4 jobs per company
-        import random
-        num_jobs = random.randint(2, 4)
+        num_jobs = randint(2, 4)
         
         for _ in range(num_jobs):
-            dept = random.choice(list(sample_titles.keys()))
-            title = random.choice(sample_titles[dept])
-            location = random.choice(locations)
+            dept = choice(departments)
+            title = choice(sample_titles[dept])
+            location = choice(locations)
             
             jobs.append({
                 'id': job_id,
@@ -173,7 +237,7 @@ def generate_sample_jobs(companies):
                 'title': title,
                 'department': dept,
                 'location': location,
-                'posted': f"{random.randint(1, 7)}d ago",
+                'posted': f"{randint(1, 7)}d ago",
                 'url': company.get('website', '#') + '/careers',
             })
             job_id += 1
@@ -183,13 +247,12 @@ def generate_sample_jobs(companies):
 
 def export_jobs_json(jobs, output_path='data/jobs.json'):
     """Export jobs to JSON file."""
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
     
-    with open(output_path, 'w') as f:
-        json.dump({
-            'jobs': jobs,
-            'updated': datetime.now().isoformat()
-        }, f, indent=2)
+    write_json(output_path, {
+        'jobs': jobs,
+        'updated': datetime.now().isoformat()
+    })
     
     print(f"Exported {len(jobs)} jobs to {output_path}")
 
@@ -4,24 +4,56 @@ Funding Scraper - Pulls clean startup data from the free YC API
 Source: https://github.com/yc-oss/api (updated daily, no auth required)
 """
 
-import json
+import heapq
 import os
 import random
+import re
 from datetime import datetime
-import requests
+from functools import lru_cache
+
+from data_io import write_json
+from http_client import SESSION
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib decoder
+    orjson = None
 
 
 YC_API_URL = "https://yc-oss.github.io/api/companies/all.json"
 
+# The only YC API fields the rest of the pipeline reads
+YC_FIELDS = (
+    'name', 'slug', 'status', 'isHiring', 'top_company', 'team_size', 'stage', 'batch',
+    'industry', 'subindustry', 'tags', 'one_liner', 'long_description', 'website',
+)
+
+# Industry/tag keywords per category, in priority order; the first match wins
+CATEGORY_KEYWORDS = [
+    ('ai', ['artificial intelligence', 'machine learning', 'ai', 'nlp', 'computer vision', 'deep learning']),
+    ('fintech', ['fintech', 'financial', 'banking', 'payments', 'crypto', 'insurance', 'lending']),
+    ('health', ['health', 'medical', 'biotech', 'healthcare', 'drug', 'clinical', 'therapeutics']),
+    ('climate', ['climate', 'energy', 'sustainability', 'clean', 'solar', 'carbon']),
+    ('dev-tools', ['developer', 'devops', 'infrastructure', 'b2b', 'saas', 'enterprise', 'api', 'security']),
+]
+
+# One alternation per category, so each check is a single scan of the text
+_CATEGORY_PATTERNS = [
+    (category, re.compile('|'.join(map(re.escape, keywords))))
+    for category, keywords in CATEGORY_KEYWORDS
+]
+
 
 def fetch_yc_companies():
     """Fetch all YC companies from the free API."""
     print("📡 Fetching YC companies from API...")
     
     try:
-        response = requests.get(YC_API_URL, timeout=30)
+        response = SESSION.get(YC_API_URL, timeout=(3, 30))
         response.raise_for_status()
-        companies = response.json()
+        raw = orjson.loads(response.content) if orjson is not None else response.json()
+        # Keep only the fields we use so the rest of each record can be freed
+        companies = [{k: c[k] for k in YC_FIELDS if k in c} for c in raw]
         print(f"   Found {len(companies)} total YC companies")
         return companies
     except Exception as e:
@@ -35,17 +67,15 @@ def categorize_company(company):
     subindustry = (company.get('subindustry') or '').lower()
     tags = ' '.join([t.lower() for t in (company.get('tags') or [])])
     combined = f"{industry} {subindustry} {tags}"
-    
-    if any(kw in combined for kw in ['artificial intelligence', 'machine learning', 'ai', 'nlp', 'computer vision', 'deep learning']):
-        return 'ai'
-    elif any(kw in combined for kw in ['fintech', 'financial', 'banking', 'payments', 'crypto', 'insurance', 'lending']):
-        return 'fintech'
-    elif any(kw in combined for kw in ['health', 'medical', 'biotech', 'healthcare', 'drug', 'clinical', 'therapeutics']):
-        return 'health'
-    elif any(kw in combined for kw in ['climate', 'energy', 'sustainability', 'clean', 'solar', 'carbon']):
-        return 'climate'
-    elif any(kw in combined for kw in ['developer', 'devops', 'infrastructure', 'b2b', 'saas', 'enterprise', 'api', 'security']):
-        return 'dev-tools'
+    return categorize_text(combined)
+
+
+@lru_cache(maxsize=4096)
+def categorize_text(text):
+    """Return the first category whose keywords appear in lowercased text."""
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(text):
+            return category
     return 'other'
 
 
@@ -96,9 +126,8 @@ def filter_and_rank_companies(companies, limit=30):
         c['_score'] = score
         scored.append(c)
     
-    # Sort by score, take top N
-    scored.sort(key=lambda x: x['_score'], reverse=True)
-    return scored[:limit]
+    # Take the top N by score without sorting the rest
+    return heapq.nlargest(limit, scored, key=lambda x: x['_score'])
 
 
 def format_company(company):
@@ -158,16 +187,18 @@ def generate_jobs(companies):
     jobs = []
     job_id = 1
     
-    random.seed(42)  # Consistent output
+    rng = random.Random(42)  # Consistent output
+    randint, choice = rng.randint, rng.choice
+    departments = list(titles)
     
     for company in companies:
         # More jobs for hiring companies
-        num_jobs = random.randint(3, 5) if company.get('isHiring') else random.randint(1, 2)
+        num_jobs = randint(3, 5) if company.get('isHiring') else randint(1, 2)
         
         used_titles = set()
         for _ in range(num_jobs):
-            dept = random.choice(list(titles.keys()))
-            title = random.choice(titles[dept])
+            dept = choice(departments)
+            title = choice(titles[dept])
             
             # Avoid duplicate titles per company
             if title in used_titles:
@@ -179,8 +210,8 @@ def generate_jobs(companies):
                 'companyId': company['id'],
                 'title': title,
                 'department': dept,
-                'location': random.choice(locations),
-                'posted': f"{random.randint(1, 14)}d ago",
+                'location': choice(locations),
+                'posted': f"{randint(1, 14)}d ago",
                 'url': company.get('website', '#') + '/careers' if company.get('website') else '#',
             })
             job_id += 1
@@ -191,12 +222,10 @@ def generate_jobs(companies):
 def save_data(companies, jobs):
     """Save to JSON files."""
     os.makedirs('data', exist_ok=True)
+    updated = datetime.now().isoformat()
     
-    with open('data/companies.json', 'w') as f:
-        json.dump({'companies': companies, 'updated': datetime.now().isoformat()}, f, indent=2)
-    
-    with open('data/jobs.json', 'w') as f:
-        json.dump({'jobs': jobs, 'updated': datetime.now().isoformat()}, f, indent=2)
+    write_json('data/companies.json', {'companies': companies, 'updated': updated})
+    write_json('data/jobs.json', {'jobs': jobs, 'updated': updated})
     
     print(f"✅ Saved {len(companies)} companies to data/companies.json")
     print(f"✅ Saved {len(jobs)} jobs to data/jobs.json")
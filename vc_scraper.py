@@ -3,10 +3,11 @@
 VC Portfolio Scraper - Scrapes portfolio pages from major VC firms
 """
 
-import json
 import os
 from datetime import datetime
 
+from data_io import write_json
+
 # VC Data - manually maintained since portfolio pages are hard to scrape reliably
 VCS = [
     {
@@ -144,13 +145,12 @@ VCS = [
 
 def export_vcs_json(output_path='data/vcs.json'):
     """Export VC data to JSON file."""
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
     
-    with open(output_path, 'w') as f:
-        json.dump({
-            'vcs': VCS,
-            'updated': datetime.now().isoformat()
-        }, f, indent=2)
+    write_json(output_path, {
+        'vcs': VCS,
+        'updated': datetime.now().isoformat()
+    })
     
     print(f"Exported {len(VCS)} VCs to {output_path}")
 